@@ -15,6 +15,7 @@ Requirements:
 
 Output:
     Prints backtest results including:
+    - Pre-validation metrics computed from the price series alone
     - Total return percentage
     - Number of trades
     - Win rate
@@ -30,11 +31,19 @@ Example Output:
     Period: 2023-01-01 to 2023-12-31
     Initial Capital: $100,000.00
 
+    Pre-validation (price series):
+      Annualized Return: +39.42%
+      Max Drawdown:      -10.61%
+      Sharpe Ratio:      1.98
+
+    Running backtest...
+    Backtest complete.
+
     Performance Metrics:
     --------------------------------------------------
-    Total Return:     +48.25%
-    Annualized Return: +48.25%
-    CAGR:             +48.25%
+    Total Return:     +34.69%
+    Annualized Return: +35.25%
+    CAGR:             +35.25%
     Win Rate:         100.00%
     Profit Factor:    N/A (no losing trades)
     Max Drawdown:     -12.34%
@@ -45,23 +54,38 @@ Example Output:
     Total Trades:     1
     Winning Trades:   1
     Losing Trades:    0
-    Average Win:      $48,250.00
+    Total P&L:        $34,694.00
+    Average Win:      $34,694.00
     Average Loss:     $0.00
+    Avg Duration:     360.0 days
 
     Trade Details:
     --------------------------------------------------
     Trade #1: AAPL
       Entry: 2023-01-03 at $130.50 (550 shares)
       Exit:  2023-12-29 at $193.58 (550 shares)
-      P&L:   +$34,694.00 (+48.25%)
+      P&L:   +48.34% ($34,694.00)
       Duration: 360 days
       Reason: end_of_data
+
+    If the pre-validation Sharpe ratio is below PREVALIDATION_MIN_SHARPE, the
+    simulation is skipped and the run ends after the pre-validation block with:
+
+    Skipping backtest: Sharpe -1.35 is below the pre-validation threshold of -1.00.
 """
+import contextlib
+import functools
+import importlib.util
+import io
 import logging
+import multiprocessing as mp
 import os
 import sys
+import tempfile
+import time
 from datetime import datetime, timezone
 from decimal import Decimal
+from multiprocessing import shared_memory
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -71,76 +95,538 @@ from dotenv import load_dotenv
 # Since backtest.py is in the project root, this IS the project root.
 project_root = Path(__file__).resolve().parent
 
-# 2. Point to the .env file in this same folder
+# 2. Point to the .env file in this same folder (loaded once by _ensure_env())
 env_path = project_root / ".env"
+_ENV_LOADED = False
+
+# 3. Cap native thread pools. BLAS reads these env vars when NumPy is first
+# imported (the engine import below pulls it in), so set them before that.
+MAX_COMPUTE_THREADS = min(8, os.cpu_count() or 1)
+os.environ.setdefault("OMP_NUM_THREADS", str(MAX_COMPUTE_THREADS))
+os.environ.setdefault("OPENBLAS_NUM_THREADS", str(MAX_COMPUTE_THREADS))
 
-# 3. Load the .env file
-loaded = load_dotenv(dotenv_path=env_path)
+# 4. Ensure imports work. When run as a script (or from an editable install) the
+# project root is already importable, so only fall back to extending sys.path.
+# Append rather than insert so stdlib and site-packages still resolve first.
+def _is_importable(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:  # Parent package (e.g. "src") not found
+        return False
 
-# Debug: Verify it worked
-print(f"DEBUG: Loading .env from: {env_path}")
-print(f"DEBUG: Success? {loaded}")
 
-# 4. Ensure imports work by adding project root to Python path
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+if not (_is_importable("src.trading_bot") and _is_importable("examples")):
+    if str(project_root) not in sys.path:
+        sys.path.append(str(project_root))
 
 # --- CONFIGURATION END ---
 
+# Check if engine is available (it may not be implemented yet). Done before the
+# yfinance/pyarrow imports below so a partial build exits without loading them.
+# (pandas still loads here via src/trading_bot/__init__.py.)
+try:
+    from src.trading_bot.backtest.engine import BacktestEngine, utc_datetimes
+    ENGINE_AVAILABLE = True
+except ImportError:
+    ENGINE_AVAILABLE = False
+    print("WARNING: BacktestEngine not yet implemented.")
+    print("This example will be functional once T027 (BacktestEngine) is completed.")
+    sys.exit(0)
+
 # ... Continue with your normal imports ...
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import yfinance as yf
+
 # Note: Since backtest.py is in the root, we import directly from src or examples
 from examples.sample_strategies import BuyAndHoldStrategy
-from src.trading_bot.backtest.models import BacktestConfig
+from src.trading_bot.backtest.models import BacktestConfig, BacktestResult, Trade
 
 logger = logging.getLogger(__name__)
 
-# Check if engine is available (it may not be implemented yet)
-try:
-    from src.trading_bot.backtest.engine import BacktestEngine
-    ENGINE_AVAILABLE = True
-except ImportError:
-    ENGINE_AVAILABLE = False
-    print("WARNING: BacktestEngine not yet implemented.")
-    print("This example will be functional once T027 (BacktestEngine) is completed.")
-    sys.exit(0)
+# Parquet cache for fetched bars, outside the repo (.backtest_cache is tracked)
+CACHE_DIR = Path.home() / ".cache" / "trading_bot" / "ohlcv"
+CACHE_TTL_SECONDS = 86400  # Refetch once a day so recent bars stay current
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+DATE_FORMAT = "%Y-%m-%d"
 
+# Pre-screen: skip the full simulation when the price series alone is this poor
+TRADING_DAYS_PER_YEAR = 252
+PREVALIDATION_MIN_SHARPE = -1.0
 
-def format_currency(value: Decimal) -> str:
-    """Format Decimal as currency string."""
+
+@functools.lru_cache(maxsize=4096)
+def _format_currency(value: float) -> str:
     return f"${value:,.2f}"
 
 
-def format_percentage(value: Decimal) -> str:
-    """Format Decimal as percentage string."""
+@functools.lru_cache(maxsize=4096)
+def _format_percentage(value: float) -> str:
     return f"{value * 100:+.2f}%"
 
-def fetch_historical_data(symbol: str = "SPY", period: str = "2y") -> pd.DataFrame:
-    """Fetch historical OHLCV data.
+
+# "+ 0.0" folds -0.0 into 0.0: they compare and hash equal, so would otherwise
+# share a cache slot and leak "-0.00" into later zero values.
+def format_currency(value: float | Decimal) -> str:
+    """Format value as currency string (Decimal is converted to float once)."""
+    return _format_currency(float(value) + 0.0)
+
+
+def format_percentage(value: float | Decimal) -> str:
+    """Format fractional value as percentage string (Decimal is converted to float once)."""
+    return _format_percentage(float(value) + 0.0)
+
+
+def extract_trade_arrays(trades: list[Trade]) -> dict[str, np.ndarray]:
+    """Extract per-trade numeric fields into NumPy arrays in a single pass.
+
+    Args:
+        trades: Completed trades from a BacktestResult
+
+    Returns:
+        Dict of arrays: entry_price, exit_price, pnl, pnl_pct (float64),
+        shares (int64) and duration_days (int32)
+    """
+    n = len(trades)
+    return {
+        "entry_price": np.fromiter((float(t.entry_price) for t in trades), np.float64, count=n),
+        "exit_price": np.fromiter((float(t.exit_price) for t in trades), np.float64, count=n),
+        "shares": np.fromiter((t.shares for t in trades), np.int64, count=n),
+        "pnl": np.fromiter((float(t.pnl) for t in trades), np.float64, count=n),
+        "pnl_pct": np.fromiter((float(t.pnl_pct) for t in trades), np.float64, count=n),
+        "duration_days": np.fromiter((t.duration_days for t in trades), np.int32, count=n),
+    }
+
+
+def summarize_trades(arrays: dict[str, np.ndarray]) -> dict[str, float]:
+    """Summarize trade P&L with NumPy reductions.
+
+    Args:
+        arrays: Per-trade arrays from extract_trade_arrays()
+
+    Returns:
+        Dict with total_pnl, average_win, average_loss (dollars) and
+        average_duration_days
+    """
+    pnl = arrays["pnl"]
+    wins = pnl[pnl > 0]
+    losses = pnl[pnl <= 0]
+    durations = arrays["duration_days"]
+
+    return {
+        "total_pnl": float(pnl.sum()),
+        "average_win": float(wins.mean()) if wins.size else 0.0,
+        "average_loss": float(losses.mean()) if losses.size else 0.0,
+        "average_duration_days": float(durations.mean()) if durations.size else 0.0,
+    }
+
+
+def _ensure_env() -> None:
+    """Load the .env file on first call only, so repeated main() runs skip re-parsing it."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+
+    loaded = load_dotenv(dotenv_path=env_path)
+
+    # Debug: Verify it worked
+    print(f"DEBUG: Loading .env from: {env_path}")
+    print(f"DEBUG: Success? {loaded}")
+
+    _ENV_LOADED = True
+
+
+def fast_metrics(close: np.ndarray, risk_free_rate: float = 0.02) -> dict[str, float]:
+    """Compute path-independent metrics straight from a close-price series.
+
+    Sharpe ratio, annualized return and max drawdown depend only on the price
+    path, so they are computed with a few NumPy reductions over log returns
+    instead of a bar-by-bar simulation. Used to reject obviously poor series
+    before running the engine.
+
+    Args:
+        close: Close prices in chronological order
+        risk_free_rate: Annual risk-free rate
+
+    Returns:
+        Dict with sharpe, annualized_return and max_drawdown (positive fraction)
+    """
+    close = np.asarray(close, dtype=np.float64)
+    if close.size < 2:
+        return {"sharpe": 0.0, "annualized_return": 0.0, "max_drawdown": 0.0}
+
+    log_returns = np.diff(np.log(close))
+    annualized_return = log_returns.mean() * TRADING_DAYS_PER_YEAR
+    volatility = (
+        log_returns.std(ddof=1) * np.sqrt(TRADING_DAYS_PER_YEAR)
+        if log_returns.size > 1 else 0.0
+    )
+    sharpe = (annualized_return - risk_free_rate) / volatility if volatility > 0 else 0.0
+
+    # Drawdown from the running peak, including the first bar
+    drawdown = 1.0 - close / np.maximum.accumulate(close)
+
+    return {
+        "sharpe": float(sharpe),
+        "annualized_return": float(annualized_return),
+        "max_drawdown": float(max(drawdown.max(), 0.0)),
+    }
+
+
+def _cache_path(symbol: str, period: str, interval: str) -> Path:
+    """Return the parquet cache file for (symbol, period, interval)."""
+    return CACHE_DIR / f"{symbol}_{period}_{interval}.parquet"
+
+
+def _load_cached(cache_path: Path) -> pd.DataFrame | None:
+    """Load cached bars if the cache file exists and has not expired.
+
+    An unreadable cache file is treated as a miss and removed, so it is
+    refetched instead of failing every run until it expires.
+    """
+    try:
+        if time.time() - cache_path.stat().st_mtime >= CACHE_TTL_SECONDS:
+            return None
+    except OSError:  # Missing (or unreadable) cache file
+        return None
+
+    try:
+        return pd.read_parquet(cache_path, engine="pyarrow", columns=OHLCV_COLUMNS)
+    except Exception as e:
+        logger.warning(f"Discarding unreadable cache file {cache_path}: {e}")
+        with contextlib.suppress(OSError):
+            cache_path.unlink(missing_ok=True)
+        return None
+
+
+def _save_cached(data: pd.DataFrame, cache_path: Path) -> None:
+    """Write bars to the parquet cache; failures are logged, never raised.
+
+    Written to a temp file in CACHE_DIR and moved into place with os.replace,
+    so an interrupted run cannot leave a truncated cache file behind.
+    """
+    tmp_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".parquet.tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        data.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write cache file {cache_path}: {e}")
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        return
+    logger.info(f"Saved {len(data)} bars to cache: {cache_path}")
+
+
+def _extract_symbol(downloaded: pd.DataFrame, symbol: str) -> pd.DataFrame | None:
+    """Pull one symbol's OHLCV bars out of a yf.download result.
+
+    Returns:
+        DataFrame with lowercase float64 OHLCV columns, or None (logged) if
+        Yahoo returned no bars for symbol
+    """
+    # yf.download returns an empty frame (no OHLCV columns) when every ticker fails
+    if downloaded.empty:
+        logger.error(f"No data returned for {symbol}")
+        return None
+
+    if isinstance(downloaded.columns, pd.MultiIndex):
+        if symbol not in downloaded.columns.get_level_values(0):
+            logger.error(f"No data returned for {symbol}")
+            return None
+        data = downloaded[symbol]
+    else:
+        data = downloaded
+
+    # Rename columns to match expected format. Not inplace: data may be a slice of
+    # the multi-ticker frame, and renaming it in place warns SettingWithCopy.
+    data = data.rename(columns=str.lower)
+
+    # Keep OHLCV as contiguous float64 for vectorized math downstream
+    data = data[OHLCV_COLUMNS].dropna(how="all").astype(np.float64, copy=False)
+
+    if data.empty:
+        logger.error(f"No data returned for {symbol}")
+        return None
+    return data
+
+
+def fetch_historical_data_batch(
+    symbols: list[str],
+    period: str = "2y",
+    interval: str = "1d",
+    cache_enabled: bool = True,
+) -> dict[str, pd.DataFrame]:
+    """Fetch historical OHLCV data for several symbols in one request.
+
+    Symbols with a fresh parquet cache file are loaded from disk; the rest are
+    downloaded together via yf.download (one multi-ticker request, threaded
+    inside yfinance) and then cached individually.
+
+    Args:
+        symbols: Ticker symbols
+        period: Data period (1y, 2y, 5y, etc.)
+        interval: Bar interval (1d, 1h, etc.)
+        cache_enabled: Whether to read/write the parquet cache
+
+    Returns:
+        Dict mapping symbol to DataFrame with OHLCV data. Symbols Yahoo
+        returned no bars for are omitted.
+    """
+    market_data = {
+        symbol: cached
+        for symbol in symbols
+        if cache_enabled
+        and (cached := _load_cached(_cache_path(symbol, period, interval))) is not None
+    }
+    if market_data:
+        logger.info(f"Loaded {', '.join(market_data)} from cache")
+
+    missing = [symbol for symbol in symbols if symbol not in market_data]
+    if not missing:
+        return market_data
+
+    logger.info(f"Fetching historical data for {', '.join(missing)} ({period})")
+
+    # No session= here: yfinance keeps its own keep-alive session across calls,
+    # and newer releases reject caching sessions (requests_cache) outright.
+    downloaded = yf.download(
+        missing,
+        period=period,
+        interval=interval,
+        group_by="ticker",
+        auto_adjust=True,  # Match Ticker.history() adjusted prices
+        threads=True,
+        progress=False,
+    )
+
+    fetched = {
+        symbol: data
+        for symbol in missing
+        if (data := _extract_symbol(downloaded, symbol)) is not None
+    }
+
+    for symbol, data in fetched.items():
+        logger.info(f"Downloaded {len(data)} bars of data for {symbol}")
+        if cache_enabled:
+            _save_cached(data, _cache_path(symbol, period, interval))
+
+    market_data.update(fetched)
+    return market_data
+
+
+def fetch_historical_data(
+    symbol: str = "SPY",
+    period: str = "2y",
+    interval: str = "1d",
+    cache_enabled: bool = True,
+) -> pd.DataFrame:
+    """Fetch historical OHLCV data for a single symbol.
 
     Args:
         symbol: Ticker symbol
         period: Data period (1y, 2y, 5y, etc.)
+        interval: Bar interval (1d, 1h, etc.)
+        cache_enabled: Whether to read/write the parquet cache
 
     Returns:
         DataFrame with OHLCV data
+
+    Raises:
+        ValueError: If Yahoo Finance returned no bars for symbol
     """
-    logger.info(f"Fetching historical data for {symbol} ({period})")
+    market_data = fetch_historical_data_batch([symbol], period, interval, cache_enabled)
+    if symbol not in market_data:
+        raise ValueError(f"No data returned for {symbol}")
+    return market_data[symbol]
 
-    ticker = yf.Ticker(symbol)
-    data = ticker.history(period=period, interval="1d")
 
-    # Rename columns to match expected format
-    data.columns = [c.lower() for c in data.columns]
+def to_columns(data: pd.DataFrame) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """Split an OHLCV DataFrame into float64 column arrays and datetime64 timestamps."""
+    columns = {c: data[c].to_numpy(dtype=np.float64, copy=False) for c in OHLCV_COLUMNS}
+    timestamps = data.index.values.astype("datetime64[ns]")
+    return columns, timestamps
 
-    logger.info(f"Downloaded {len(data)} bars of data")
 
-    return data
+def run_buy_and_hold(
+    config: BacktestConfig,
+    columns: dict[str, np.ndarray],
+    timestamps: np.ndarray,
+) -> BacktestResult:
+    """Compute a buy-and-hold backtest in closed form, without the bar loop.
+
+    Applies the same fill rules as BacktestEngine: buy as many shares as the
+    initial capital allows at the first bar's open, mark to each bar's close,
+    and exit at the last bar's close (end_of_data). No strategy calls, bar
+    objects or position updates are made; the equity curve is cash plus shares
+    times each close, in Decimal like the engine's.
+
+    Args:
+        config: Backtest configuration (first symbol is used)
+        columns: OHLCV arrays, as returned by to_columns()
+        timestamps: datetime64 bar timestamps (UTC)
+
+    Returns:
+        BacktestResult matching BacktestEngine().run() for BuyAndHoldStrategy
+        (apart from timing fields)
+    """
+    started = time.perf_counter()
+    symbol = config.symbols[0]
+    dates = utc_datetimes(timestamps)
+    # Same float -> Decimal conversion as BacktestEngine._bars_from_columns
+    closes = [Decimal(str(c)) for c in np.asarray(columns["close"]).tolist()]
+
+    trades: list[Trade] = []
+    equity = [config.initial_capital] * len(closes)
+
+    # Entry on the last (only) bar cannot fill, same as the engine
+    if len(closes) >= 2:
+        entry_price = Decimal(str(np.asarray(columns["open"])[0].item()))
+        shares = int(config.initial_capital / entry_price)
+
+        if shares > 0:
+            exit_price = closes[-1]
+            cost_basis = shares * entry_price
+            pnl = shares * exit_price - cost_basis - config.commission
+
+            trades.append(
+                Trade(
+                    symbol=symbol,
+                    entry_date=dates[0],
+                    entry_price=entry_price,
+                    exit_date=dates[-1],
+                    exit_price=exit_price,
+                    shares=shares,
+                    pnl=pnl,
+                    pnl_pct=pnl / cost_basis,
+                    duration_days=(dates[-1] - dates[0]).days,
+                    exit_reason="end_of_data",
+                    commission=config.commission,
+                    slippage=Decimal("0.0"),
+                )
+            )
+
+            # Entry bar is marked at the fill price, later bars at their close
+            cash = config.initial_capital - cost_basis
+            marks = [entry_price, *closes[1:]]
+            equity = [cash + shares * mark for mark in marks]
+
+    return BacktestResult(
+        config=config,
+        trades=trades,
+        equity_curve=list(zip(dates, equity, strict=True)),
+        metrics=BacktestEngine.calculate_metrics(trades),
+        data_warnings=[],
+        execution_time_seconds=max(time.perf_counter() - started, 0.001),
+        completed_at=datetime.now(timezone.utc),
+    )
+
+
+# Shared-memory array descriptor: (segment name, shape, dtype string)
+SharedArraySpec = tuple[str, tuple[int, ...], str]
+
+# Worker-local market data for run_sweep(), set once per process by _init_sweep_worker()
+_SWEEP_DATA: dict[str, tuple[dict[str, np.ndarray], np.ndarray]] = {}
+_SWEEP_SEGMENTS: list[shared_memory.SharedMemory] = []
+
+
+def _share_array(arr: np.ndarray, segments: list[shared_memory.SharedMemory]) -> SharedArraySpec:
+    """Copy arr into a new shared-memory segment and return its descriptor."""
+    segment = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    segments.append(segment)
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=segment.buf)[...] = arr
+    return segment.name, arr.shape, arr.dtype.str
+
+
+def _attach_array(spec: SharedArraySpec) -> np.ndarray:
+    """Attach to a shared-memory segment and wrap it as a read-only array (no copy)."""
+    name, shape, dtype = spec
+    segment = shared_memory.SharedMemory(name=name)
+    _SWEEP_SEGMENTS.append(segment)  # Keep mapped for the worker's lifetime
+    view: np.ndarray = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+    view.flags.writeable = False
+    return view
+
+
+def _init_sweep_worker(
+    specs_by_symbol: dict[str, tuple[dict[str, SharedArraySpec], SharedArraySpec]]
+) -> None:
+    """Pool initializer: attach to the shared market data once per worker process."""
+    global _SWEEP_DATA
+    _SWEEP_DATA = {
+        symbol: (
+            {name: _attach_array(spec) for name, spec in column_specs.items()},
+            _attach_array(timestamp_spec),
+        )
+        for symbol, (column_specs, timestamp_spec) in specs_by_symbol.items()
+    }
+
+
+def _run_sweep_config(config: BacktestConfig) -> BacktestResult:
+    """Run one sweep configuration against the worker's market data."""
+    columns, timestamps = _SWEEP_DATA[config.symbols[0]]
+    return BacktestEngine().run(config, columns=columns, timestamps=timestamps)
+
+
+def run_sweep(
+    configs: list[BacktestConfig],
+    data_by_symbol: dict[str, tuple[dict[str, np.ndarray], np.ndarray]],
+    processes: int | None = None,
+) -> list[BacktestResult]:
+    """Run many backtest configurations in parallel worker processes.
+
+    Market data arrays are copied once into shared memory; workers attach
+    read-only views in the pool initializer, so neither tasks nor workers
+    pickle or duplicate the OHLCV data. On Linux the fork start method is used.
+
+    Args:
+        configs: Backtest configurations; each runs on the data for its first symbol
+        data_by_symbol: (columns, timestamps) per symbol, as returned by to_columns()
+        processes: Worker count (default: os.cpu_count())
+
+    Returns:
+        BacktestResult per config, in the same order as configs
+    """
+    if not configs:
+        return []
+
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(1, len(configs) // (processes * 4))
+    context = mp.get_context("fork") if sys.platform.startswith("linux") else mp.get_context()
+
+    segments: list[shared_memory.SharedMemory] = []
+    try:
+        specs_by_symbol = {
+            symbol: (
+                {name: _share_array(arr, segments) for name, arr in columns.items()},
+                _share_array(timestamps, segments),
+            )
+            for symbol, (columns, timestamps) in data_by_symbol.items()
+        }
+
+        with context.Pool(
+            processes,
+            initializer=_init_sweep_worker,
+            initargs=(specs_by_symbol,),
+        ) as pool:
+            return pool.map(_run_sweep_config, configs, chunksize=chunksize)
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
 
 
 def main() -> None:
     """Run simple backtest example."""
+    _ensure_env()
+
+    # Arrow's compute pool defaults to every logical CPU; match the BLAS cap
+    pa.set_cpu_count(MAX_COMPUTE_THREADS)
+
     print("=== Simple Backtest: AAPL 2023 ===")
     print()
 
@@ -153,23 +639,6 @@ def main() -> None:
         print("Backtest will attempt to use Yahoo Finance fallback.")
         print()
 
-    symbols = ["AAPL"]
-    market_data = {}
-
-    for symbol in symbols:
-        try:
-            data = fetch_historical_data(symbol, period="2y")
-            market_data[symbol] = data
-        except Exception as e:
-            logger.error(f"Failed to fetch {symbol}: {e}")
-
-    if not market_data:
-        logger.error("No market data available. Exiting.")
-        return
-
-    # Use SPY for main pipeline
-    data = market_data["AAPL"]
-    
     # Configure backtest
     config = BacktestConfig(
         strategy_class=BuyAndHoldStrategy,
@@ -183,69 +652,125 @@ def main() -> None:
         cache_enabled=True,
     )
 
+    try:
+        market_data = fetch_historical_data_batch(
+            config.symbols, period="2y", cache_enabled=config.cache_enabled
+        )
+    except Exception as e:
+        logger.error(f"Failed to fetch {', '.join(config.symbols)}: {e}")
+        market_data = {}
+
+    if not market_data:
+        logger.error("No market data available. Exiting.")
+        return
+
+    # Use AAPL for main pipeline
+    data = market_data["AAPL"]
+
+    # Hand the engine contiguous column arrays instead of the DataFrame
+    columns, timestamps = to_columns(data)
+
     print(f"Strategy: {config.strategy_class.__name__}")
     print(f"Symbol: {config.symbols[0]}")
-    print(f"Period: {config.start_date.date()} to {config.end_date.date()}")
+    start_str = config.start_date.strftime(DATE_FORMAT)
+    end_str = config.end_date.strftime(DATE_FORMAT)
+    print(f"Period: {start_str} to {end_str}")
     print(f"Initial Capital: {format_currency(config.initial_capital)}")
     print()
 
+    # Pre-screen with vectorized metrics before the full simulation
+    screen = fast_metrics(columns["close"], float(config.risk_free_rate))
+    print("Pre-validation (price series):")
+    print(f"  Annualized Return: {format_percentage(screen['annualized_return'])}")
+    print(f"  Max Drawdown:      {format_percentage(-screen['max_drawdown'])}")
+    print(f"  Sharpe Ratio:      {screen['sharpe']:.2f}")
+    print()
+
+    if screen["sharpe"] < PREVALIDATION_MIN_SHARPE:
+        print(
+            f"Skipping backtest: Sharpe {screen['sharpe']:.2f} is below "
+            f"the pre-validation threshold of {PREVALIDATION_MIN_SHARPE:.2f}."
+        )
+        return
+
     # Run backtest
     print("Running backtest...")
-    engine = BacktestEngine()
-    result = engine.run(config, historical_data=data)
+    if config.strategy_class is BuyAndHoldStrategy:
+        # Closed-form fast path: no bar-by-bar simulation needed
+        result = run_buy_and_hold(config, columns, timestamps)
+    else:
+        engine = BacktestEngine()
+        result = engine.run(config, columns=columns, timestamps=timestamps)
     print("Backtest complete.")
     print()
 
+    # Build the report in memory and write it in one call
+    report = io.StringIO()
+
     # Print performance metrics
     metrics = result.metrics
-    print("Performance Metrics:")
-    print("-" * 50)
-    print(f"Total Return:     {format_percentage(metrics.total_return)}")
-    print(f"Annualized Return: {format_percentage(metrics.annualized_return)}")
-    print(f"CAGR:             {format_percentage(metrics.cagr)}")
-    print(f"Win Rate:         {metrics.win_rate * 100:.2f}%")
+    print("Performance Metrics:", file=report)
+    print("-" * 50, file=report)
+    print(f"Total Return:     {format_percentage(metrics.total_return)}", file=report)
+    print(f"Annualized Return: {format_percentage(metrics.annualized_return)}", file=report)
+    print(f"CAGR:             {format_percentage(metrics.cagr)}", file=report)
+    print(f"Win Rate:         {metrics.win_rate * 100:.2f}%", file=report)
     if metrics.profit_factor > 0:
-        print(f"Profit Factor:    {metrics.profit_factor:.2f}")
+        print(f"Profit Factor:    {metrics.profit_factor:.2f}", file=report)
     else:
-        print("Profit Factor:    N/A (no losing trades)")
-    print(f"Max Drawdown:     {format_percentage(metrics.max_drawdown)}")
-    print(f"Sharpe Ratio:     {metrics.sharpe_ratio:.2f}")
-    print()
+        print("Profit Factor:    N/A (no losing trades)", file=report)
+    print(f"Max Drawdown:     {format_percentage(metrics.max_drawdown)}", file=report)
+    print(f"Sharpe Ratio:     {metrics.sharpe_ratio:.2f}", file=report)
+    print(file=report)
 
     # Print trade summary
-    print("Trade Summary:")
-    print("-" * 50)
-    print(f"Total Trades:     {metrics.total_trades}")
-    print(f"Winning Trades:   {metrics.winning_trades}")
-    print(f"Losing Trades:    {metrics.losing_trades}")
-    print(f"Average Win:      {format_currency(metrics.average_win)}")
-    print(f"Average Loss:     {format_currency(metrics.average_loss)}")
-    print()
-
-    # Print trade details
+    trade_arrays = extract_trade_arrays(result.trades)
+    summary = summarize_trades(trade_arrays)
+    print("Trade Summary:", file=report)
+    print("-" * 50, file=report)
+    print(f"Total Trades:     {metrics.total_trades}", file=report)
+    print(f"Winning Trades:   {metrics.winning_trades}", file=report)
+    print(f"Losing Trades:    {metrics.losing_trades}", file=report)
+    print(f"Total P&L:        {format_currency(summary['total_pnl'])}", file=report)
+    print(f"Average Win:      {format_currency(summary['average_win'])}", file=report)
+    print(f"Average Loss:     {format_currency(summary['average_loss'])}", file=report)
+    print(f"Avg Duration:     {summary['average_duration_days']:.1f} days", file=report)
+    print(file=report)
+
+    # Print trade details (numeric fields come from the pre-extracted arrays)
     if result.trades:
-        print("Trade Details:")
-        print("-" * 50)
-        for i, trade in enumerate(result.trades, 1):
-            print(f"Trade #{i}: {trade.symbol}")
-            print(f"  Entry: {trade.entry_date.date()} at {format_currency(trade.entry_price)} ({trade.shares} shares)")
-            print(f"  Exit:  {trade.exit_date.date()} at {format_currency(trade.exit_price)} ({trade.shares} shares)")
-            print(f"  P&L:   {format_percentage(trade.pnl_pct)} ({format_currency(trade.pnl)})")
-            print(f"  Duration: {trade.duration_days} days")
-            print(f"  Reason: {trade.exit_reason}")
-            print()
+        print("Trade Details:", file=report)
+        print("-" * 50, file=report)
+        entry_dates = [t.entry_date.strftime(DATE_FORMAT) for t in result.trades]
+        exit_dates = [t.exit_date.strftime(DATE_FORMAT) for t in result.trades]
+        entry_prices = trade_arrays["entry_price"].tolist()
+        exit_prices = trade_arrays["exit_price"].tolist()
+        shares = trade_arrays["shares"].tolist()
+        pnls = trade_arrays["pnl"].tolist()
+        pnl_pcts = trade_arrays["pnl_pct"].tolist()
+        durations = trade_arrays["duration_days"].tolist()
+        for i, trade in enumerate(result.trades):
+            print(f"Trade #{i + 1}: {trade.symbol}", file=report)
+            print(f"  Entry: {entry_dates[i]} at {format_currency(entry_prices[i])} ({shares[i]} shares)", file=report)
+            print(f"  Exit:  {exit_dates[i]} at {format_currency(exit_prices[i])} ({shares[i]} shares)", file=report)
+            print(f"  P&L:   {format_percentage(pnl_pcts[i])} ({format_currency(pnls[i])})", file=report)
+            print(f"  Duration: {durations[i]} days", file=report)
+            print(f"  Reason: {trade.exit_reason}", file=report)
+            print(file=report)
 
     # Print data quality warnings
     if result.data_warnings:
-        print("Data Quality Warnings:")
-        print("-" * 50)
+        print("Data Quality Warnings:", file=report)
+        print("-" * 50, file=report)
         for warning in result.data_warnings:
-            print(f"  - {warning}")
-        print()
+            print(f"  - {warning}", file=report)
+        print(file=report)
 
-    print(f"Execution Time: {result.execution_time_seconds:.2f} seconds")
-    print()
-    print("Tip: Run with different symbols or date ranges to compare performance.")
+    print(f"Execution Time: {result.execution_time_seconds:.2f} seconds", file=report)
+    print(file=report)
+    print("Tip: Run with different symbols or date ranges to compare performance.", file=report)
+
+    sys.stdout.write(report.getvalue())
 
 
 if __name__ == "__main__":
@@ -8,9 +8,12 @@ Implements TDD pattern: Tests written before implementation (T021-T024).
 """
 
 import logging
-from datetime import UTC, datetime
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
+import numpy as np
+
 from src.trading_bot.backtest.models import (
     BacktestConfig,
     BacktestResult,
@@ -25,6 +28,21 @@ from src.trading_bot.backtest.strategy_protocol import IStrategy
 logger = logging.getLogger(__name__)
 
 
+def utc_datetimes(timestamps: np.ndarray) -> list[datetime]:
+    """
+    Convert datetime64 timestamps (UTC) into timezone-aware datetimes.
+
+    Args:
+        timestamps: datetime64 values of any unit
+
+    Returns:
+        List of UTC datetimes (microsecond resolution)
+    """
+    epoch = datetime(1970, 1, 1, tzinfo=UTC)
+    micros = np.asarray(timestamps).astype("datetime64[us]").astype(np.int64).tolist()
+    return [epoch + timedelta(microseconds=us) for us in micros]
+
+
 class BacktestEngine:
     """
     Core backtesting engine for chronological strategy execution.
@@ -72,7 +90,9 @@ class BacktestEngine:
     def run(
         self,
         strategy: IStrategy | BacktestConfig | None = None,
-        historical_data: list[HistoricalDataBar] | dict[str, list[HistoricalDataBar]] | None = None
+        historical_data: list[HistoricalDataBar] | dict[str, list[HistoricalDataBar]] | None = None,
+        columns: Mapping[str, np.ndarray] | None = None,
+        timestamps: np.ndarray | None = None
     ) -> BacktestResult:
         """
         Execute backtest for given strategy and historical data.
@@ -81,9 +101,16 @@ class BacktestEngine:
         1. BacktestEngine(config).run(strategy, historical_data)
         2. BacktestEngine().run(config)  # config contains strategy_class
 
+        Historical data may alternatively be passed column-wise for the first
+        configured symbol: ``columns`` maps open/high/low/close/volume to
+        NumPy arrays and ``timestamps`` holds the matching datetime64 values
+        (UTC). Bars are built once from these arrays.
+
         Args:
             strategy: Trading strategy OR BacktestConfig if pattern 2
             historical_data: Historical bars (single symbol: List, multi: Dict)
+            columns: OHLCV arrays for the first configured symbol
+            timestamps: datetime64 bar timestamps matching ``columns``
 
         Returns:
             BacktestResult with trades, equity curve, and performance metrics
@@ -98,8 +125,10 @@ class BacktestEngine:
             # Pattern 2: BacktestEngine().run(config)
             self.config = strategy
             self.strategy = self.config.strategy_class()
-            if historical_data is None:
-                raise ValueError("historical_data required when passing config to run()")
+            if historical_data is None and columns is None:
+                raise ValueError(
+                    "historical_data or columns required when passing config to run()"
+                )
         elif strategy is None:
             # No strategy passed - check if config has strategy_class
             if self.config is None:
@@ -117,6 +146,13 @@ class BacktestEngine:
         assert self.config is not None, "config must be set"
         assert self.strategy is not None, "strategy must be set"
 
+        # Build bars from columnar arrays for the first configured symbol
+        if columns is not None:
+            if timestamps is None:
+                raise ValueError("timestamps required when passing columns to run()")
+            symbol = self.config.symbols[0]
+            historical_data = {symbol: self._bars_from_columns(symbol, columns, timestamps)}
+
         # Normalize historical_data to Dict format
         if isinstance(historical_data, list):
             # Single symbol: wrap in dict with first symbol from config
@@ -205,6 +241,57 @@ class BacktestEngine:
 
         return result
 
+    @staticmethod
+    def _bars_from_columns(
+        symbol: str,
+        columns: Mapping[str, np.ndarray],
+        timestamps: np.ndarray
+    ) -> list[HistoricalDataBar]:
+        """
+        Convert columnar OHLCV arrays into HistoricalDataBar objects.
+
+        Args:
+            symbol: Symbol the arrays belong to
+            columns: Arrays keyed by open, high, low, close, volume
+            timestamps: datetime64 bar timestamps (UTC)
+
+        Returns:
+            List of bars in the order given
+
+        Raises:
+            ValueError: If array lengths do not match timestamps
+        """
+        n_bars = len(timestamps)
+        for name in ("open", "high", "low", "close", "volume"):
+            if len(columns[name]) != n_bars:
+                raise ValueError(
+                    f"Column '{name}' has {len(columns[name])} values, "
+                    f"expected {n_bars} to match timestamps"
+                )
+
+        # tolist() yields Python scalars in one C-level pass per column
+        dates = utc_datetimes(timestamps)
+        opens = np.asarray(columns["open"]).tolist()
+        highs = np.asarray(columns["high"]).tolist()
+        lows = np.asarray(columns["low"]).tolist()
+        closes = np.asarray(columns["close"]).tolist()
+        volumes = np.asarray(columns["volume"]).tolist()
+
+        return [
+            HistoricalDataBar(
+                symbol=symbol,
+                timestamp=ts,
+                open=Decimal(str(o)),
+                high=Decimal(str(h)),
+                low=Decimal(str(lo)),
+                close=Decimal(str(c)),
+                volume=int(v)
+            )
+            for ts, o, h, lo, c, v in zip(
+                dates, opens, highs, lows, closes, volumes, strict=True
+            )
+        ]
+
     def _check_entries(
         self,
         current_bar: HistoricalDataBar,
@@ -502,6 +589,20 @@ class BacktestEngine:
         """
         Calculate performance metrics from trade history.
 
+        Returns:
+            PerformanceMetrics with all calculated statistics
+        """
+        assert self.state is not None, "state must be initialized"
+        return self.calculate_metrics(self.state.trades)
+
+    @staticmethod
+    def calculate_metrics(trades: list[Trade]) -> PerformanceMetrics:
+        """
+        Calculate performance metrics for a list of completed trades.
+
+        Args:
+            trades: Completed trades in chronological order
+
         Returns:
             PerformanceMetrics with all calculated statistics
 
@@ -510,9 +611,8 @@ class BacktestEngine:
             Full implementation in Phase 5 (US3).
         """
         # Placeholder metrics (will implement in Phase 5 - US3)
-        assert self.state is not None, "state must be initialized"
-        total_trades = len(self.state.trades)
-        winning_trades = sum((1 if trade.pnl > 0 else 0) for trade in self.state.trades)
+        total_trades = len(trades)
+        winning_trades = sum((1 if trade.pnl > 0 else 0) for trade in trades)
         losing_trades = total_trades - winning_trades
 
         win_rate = Decimal("0.0")
@@ -1,10 +1,34 @@
-"""Strategy generators using different ML approaches."""
+"""Strategy generators using different ML approaches.
 
-from src.trading_bot.ml.generators.genetic_programming import GeneticProgrammingGenerator
-from src.trading_bot.ml.generators.reinforcement_learning import ReinforcementLearningGenerator
-from src.trading_bot.ml.generators.llm_guided import LLMGuidedGenerator
-from src.trading_bot.ml.generators.rule_based import RuleBasedGenerator, RuleBasedStrategy
-from src.trading_bot.ml.generators.ensemble import RuleEnsembleGenerator, RuleEnsembleStrategy
+Generators are imported on first attribute access (PEP 562), so using one does
+not load the others' dependencies (e.g. the OpenAI client for LLMGuidedGenerator).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.trading_bot.ml.generators.genetic_programming import GeneticProgrammingGenerator
+    from src.trading_bot.ml.generators.reinforcement_learning import ReinforcementLearningGenerator
+    from src.trading_bot.ml.generators.llm_guided import LLMGuidedGenerator
+    from src.trading_bot.ml.generators.rule_based import (
+        RuleBasedGenerator,
+        RuleBasedStrategy,
+    )
+    from src.trading_bot.ml.generators.ensemble import (
+        RuleEnsembleGenerator,
+        RuleEnsembleStrategy,
+    )
+
+_LAZY_IMPORTS = {
+    "GeneticProgrammingGenerator": "src.trading_bot.ml.generators.genetic_programming",
+    "ReinforcementLearningGenerator": "src.trading_bot.ml.generators.reinforcement_learning",
+    "LLMGuidedGenerator": "src.trading_bot.ml.generators.llm_guided",
+    "RuleBasedGenerator": "src.trading_bot.ml.generators.rule_based",
+    "RuleBasedStrategy": "src.trading_bot.ml.generators.rule_based",
+    "RuleEnsembleGenerator": "src.trading_bot.ml.generators.ensemble",
+    "RuleEnsembleStrategy": "src.trading_bot.ml.generators.ensemble",
+}
 
 __all__ = [
     "GeneticProgrammingGenerator",
@@ -15,3 +39,15 @@ __all__ = [
     "RuleEnsembleGenerator",
     "RuleEnsembleStrategy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
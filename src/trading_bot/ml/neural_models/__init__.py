@@ -1,13 +1,39 @@
-"""Neural network models for multi-timeframe trading strategies."""
+"""Neural network models for multi-timeframe trading strategies.
 
-from src.trading_bot.ml.neural_models.hierarchical_net import (
-    HierarchicalTimeframeNet,
-    TimeframeEncoder,
-    MultiHeadAttention,
-)
+hierarchical_net is imported on first attribute access (PEP 562), so PyTorch is
+only loaded when a model class is used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.trading_bot.ml.neural_models.hierarchical_net import (
+        HierarchicalTimeframeNet,
+        TimeframeEncoder,
+        MultiHeadAttention,
+    )
+
+_LAZY_IMPORTS = {
+    "HierarchicalTimeframeNet": "src.trading_bot.ml.neural_models.hierarchical_net",
+    "TimeframeEncoder": "src.trading_bot.ml.neural_models.hierarchical_net",
+    "MultiHeadAttention": "src.trading_bot.ml.neural_models.hierarchical_net",
+}
 
 __all__ = [
     "HierarchicalTimeframeNet",
     "TimeframeEncoder",
     "MultiHeadAttention",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
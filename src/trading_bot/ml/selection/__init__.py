@@ -1,9 +1,30 @@
 """Strategy selection and ensemble creation."""
 
-from src.trading_bot.ml.selection.selector import StrategySelector
-from src.trading_bot.ml.selection.ensemble import EnsembleBuilder
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.trading_bot.ml.selection.selector import StrategySelector
+    from src.trading_bot.ml.selection.ensemble import EnsembleBuilder
+
+_LAZY_IMPORTS = {
+    "StrategySelector": "src.trading_bot.ml.selection.selector",
+    "EnsembleBuilder": "src.trading_bot.ml.selection.ensemble",
+}
 
 __all__ = [
     "StrategySelector",
     "EnsembleBuilder",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,26 @@
-"""Validation utilities for trading ML models."""
+"""Validation utilities for trading ML models.
 
-from src.trading_bot.ml.validation.walk_forward import (
-    WalkForwardValidator,
-    WalkForwardConfig,
-    WalkForwardResults,
-    FoldResult,
-)
+walk_forward is imported on first attribute access (PEP 562), so PyTorch is only
+loaded when walk-forward validation is used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.trading_bot.ml.validation.walk_forward import (
+        WalkForwardValidator,
+        WalkForwardConfig,
+        WalkForwardResults,
+        FoldResult,
+    )
+
+_LAZY_IMPORTS = {
+    "WalkForwardValidator": "src.trading_bot.ml.validation.walk_forward",
+    "WalkForwardConfig": "src.trading_bot.ml.validation.walk_forward",
+    "WalkForwardResults": "src.trading_bot.ml.validation.walk_forward",
+    "FoldResult": "src.trading_bot.ml.validation.walk_forward",
+}
 
 __all__ = [
     "WalkForwardValidator",
@@ -13,3 +28,15 @@ __all__ = [
     "WalkForwardResults",
     "FoldResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,21 +2,36 @@
 Trading Orchestrator Module
 
 Coordinates LLM-enhanced trading workflows using Claude Code in headless mode.
+
+Submodules are imported on first attribute access (PEP 562), so the Alpaca
+trading client is only loaded when TradingOrchestrator is used.
 """
 
-from src.trading_bot.orchestrator.workflow import (
-    WorkflowState,
-    WorkflowTransition,
-    WorkflowContext,
-    WorkflowStateMachine
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from src.trading_bot.orchestrator.scheduler import (
-    TradingScheduler,
-    ScheduledTask
-)
+if TYPE_CHECKING:
+    from src.trading_bot.orchestrator.workflow import (
+        WorkflowState,
+        WorkflowTransition,
+        WorkflowContext,
+        WorkflowStateMachine,
+    )
+    from src.trading_bot.orchestrator.scheduler import (
+        TradingScheduler,
+        ScheduledTask,
+    )
+    from src.trading_bot.orchestrator.trading_orchestrator import TradingOrchestrator
 
-from src.trading_bot.orchestrator.trading_orchestrator import TradingOrchestrator
+_LAZY_IMPORTS = {
+    "WorkflowState": "src.trading_bot.orchestrator.workflow",
+    "WorkflowTransition": "src.trading_bot.orchestrator.workflow",
+    "WorkflowContext": "src.trading_bot.orchestrator.workflow",
+    "WorkflowStateMachine": "src.trading_bot.orchestrator.workflow",
+    "TradingScheduler": "src.trading_bot.orchestrator.scheduler",
+    "ScheduledTask": "src.trading_bot.orchestrator.scheduler",
+    "TradingOrchestrator": "src.trading_bot.orchestrator.trading_orchestrator",
+}
 
 __all__ = [
     "WorkflowState",
@@ -27,3 +42,15 @@ __all__ = [
     "ScheduledTask",
     "TradingOrchestrator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
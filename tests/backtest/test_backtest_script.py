@@ -0,0 +1,493 @@
+"""
+Tests for the root backtest.py script helpers.
+
+Covers the memoized report formatters, the vectorized pre-validation metrics
+(fast_metrics), the closed-form buy-and-hold fast path (run_buy_and_hold) and
+when main() takes it, the multiprocessing parameter sweep (run_sweep) with its
+shared-memory market data, and the batch yf.download fetch path with its
+parquet cache (yf.download is stubbed, no network).
+"""
+
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+from datetime import datetime, timezone
+from decimal import Decimal
+from multiprocessing import shared_memory
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+backtest_script = pytest.importorskip("backtest")
+
+from examples.sample_strategies import BuyAndHoldStrategy
+from src.trading_bot.backtest.engine import BacktestEngine
+from src.trading_bot.backtest.models import BacktestConfig
+
+
+class TestFormatting:
+    """Test the memoized currency/percentage formatters."""
+
+    def test_negative_zero_does_not_poison_cache(self):
+        """-0.0 shares a cache slot with 0.0, so formatting it first must not leak a sign."""
+        backtest_script._format_percentage.cache_clear()
+        backtest_script._format_currency.cache_clear()
+
+        assert backtest_script.format_percentage(-0.0) == "+0.00%"
+        assert backtest_script.format_percentage(0.0) == "+0.00%"
+
+        assert backtest_script.format_currency(-0.0) == "$0.00"
+        assert backtest_script.format_currency(0.0) == "$0.00"
+
+    def test_decimal_matches_float(self):
+        """Decimal inputs format the same as the equivalent floats."""
+        for value in ("0", "-0.0", "1234.5", "-987.654", "0.4825"):
+            assert backtest_script.format_currency(Decimal(value)) == \
+                backtest_script.format_currency(float(value))
+            assert backtest_script.format_percentage(Decimal(value)) == \
+                backtest_script.format_percentage(float(value))
+
+    def test_formats(self):
+        """Currency uses thousands separators; percentage is signed, from a fraction."""
+        assert backtest_script.format_currency(34694.0) == "$34,694.00"
+        assert backtest_script.format_percentage(Decimal("0.4825")) == "+48.25%"
+        assert backtest_script.format_percentage(-0.1234) == "-12.34%"
+
+
+class TestFastMetrics:
+    """Test path-independent metrics computed from a close-price series."""
+
+    def test_max_drawdown_includes_first_bar(self):
+        """Drawdown is measured from the running peak, starting at the first close."""
+        metrics = backtest_script.fast_metrics(np.array([100.0, 80.0, 120.0, 90.0]))
+
+        assert metrics["max_drawdown"] == pytest.approx(0.25)
+
+    def test_drop_right_after_first_bar(self):
+        """A decline starting on bar 1 is still a drawdown."""
+        metrics = backtest_script.fast_metrics(np.array([100.0, 80.0]))
+
+        assert metrics["max_drawdown"] == pytest.approx(0.2)
+
+    def test_annualized_return_and_sharpe(self):
+        """Annualized return is mean log return x 252; Sharpe uses sample std."""
+        close = np.array([100.0, 101.0, 100.5, 102.0, 103.0])
+        log_returns = np.diff(np.log(close))
+        expected_ann = log_returns.mean() * 252
+        expected_vol = log_returns.std(ddof=1) * np.sqrt(252)
+
+        metrics = backtest_script.fast_metrics(close, risk_free_rate=0.02)
+
+        assert metrics["annualized_return"] == pytest.approx(expected_ann)
+        assert metrics["sharpe"] == pytest.approx((expected_ann - 0.02) / expected_vol)
+
+    def test_flat_series_has_zero_sharpe(self):
+        """Zero volatility yields Sharpe 0.0 instead of dividing by zero."""
+        metrics = backtest_script.fast_metrics(np.full(10, 50.0))
+
+        assert metrics == {"sharpe": 0.0, "annualized_return": 0.0, "max_drawdown": 0.0}
+
+    def test_single_bar_returns_zeros(self):
+        """Fewer than two closes gives zero metrics."""
+        metrics = backtest_script.fast_metrics(np.array([100.0]))
+
+        assert metrics == {"sharpe": 0.0, "annualized_return": 0.0, "max_drawdown": 0.0}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="sweep uses fork on Linux")
+class TestRunSweep:
+    """Test the multiprocessing sweep driver and its shared-memory data path."""
+
+    @pytest.fixture
+    def market_data(self):
+        """Two symbols of 30 daily bars as (columns, timestamps)."""
+        data = {}
+        for symbol, start_price in (("AAPL", 150.0), ("MSFT", 300.0)):
+            close = start_price + np.arange(30, dtype=np.float64)
+            columns = {
+                "open": close - 0.25,
+                "high": close + 0.5,
+                "low": close - 0.5,
+                "close": close,
+                "volume": np.full(30, 1_000_000.0),
+            }
+            timestamps = np.arange(
+                np.datetime64("2024-01-02"), np.datetime64("2024-02-01")
+            ).astype("datetime64[ns]")
+            data[symbol] = (columns, timestamps)
+        return data
+
+    @staticmethod
+    def _config(symbol: str, capital: str) -> BacktestConfig:
+        return BacktestConfig(
+            strategy_class=BuyAndHoldStrategy,
+            symbols=[symbol],
+            start_date=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 31, tzinfo=timezone.utc),
+            initial_capital=Decimal(capital),
+            cache_enabled=False
+        )
+
+    def test_sweep_matches_serial_runs(self, market_data):
+        """Results come back in config order and match in-process engine runs."""
+        configs = [
+            self._config("AAPL", "10000"),
+            self._config("MSFT", "10000"),
+            self._config("AAPL", "50000"),
+        ]
+
+        results = backtest_script.run_sweep(configs, market_data, processes=2)
+
+        assert len(results) == len(configs)
+        for config, result in zip(configs, results, strict=True):
+            columns, timestamps = market_data[config.symbols[0]]
+            expected = BacktestEngine().run(config, columns=columns, timestamps=timestamps)
+            assert result.config == config
+            assert result.trades == expected.trades
+            assert result.equity_curve == expected.equity_curve
+
+    def test_shared_memory_is_unlinked(self, market_data, monkeypatch):
+        """Every segment created for the sweep is removed when it finishes."""
+        created = []
+        share_array = backtest_script._share_array
+
+        def recording_share_array(arr, segments):
+            spec = share_array(arr, segments)
+            created.append(spec[0])
+            return spec
+
+        monkeypatch.setattr(backtest_script, "_share_array", recording_share_array)
+
+        backtest_script.run_sweep([self._config("AAPL", "10000")], market_data, processes=2)
+
+        # 2 symbols x (5 columns + timestamps)
+        assert len(created) == 12
+        for name in created:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_empty_sweep(self, market_data):
+        """No configs means no pool and no results."""
+        assert backtest_script.run_sweep([], market_data) == []
+
+
+class TestBuyAndHoldFastPath:
+    """Test the closed-form buy-and-hold backtest and when main() uses it."""
+
+    @pytest.fixture
+    def year_columns(self):
+        """252 daily bars rising linearly from $150 to $165, as (columns, timestamps)."""
+        close = np.linspace(150.0, 165.0, 252)
+        columns = {
+            "open": close - 0.25,
+            "high": close + 0.5,
+            "low": close - 0.5,
+            "close": close,
+            "volume": np.full(252, 1_000_000.0),
+        }
+        timestamps = (
+            np.datetime64("2023-01-03T09:30") + np.arange(252) * np.timedelta64(1, "D")
+        ).astype("datetime64[ns]")
+        return columns, timestamps
+
+    def test_closed_form_matches_engine(self, year_columns):
+        """run_buy_and_hold() reproduces BacktestEngine().run() trades, equity and metrics."""
+        config = BacktestConfig(
+            strategy_class=BuyAndHoldStrategy,
+            symbols=["AAPL"],
+            start_date=datetime(2023, 1, 3, 9, 30, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            initial_capital=Decimal("100000.00"),
+            commission=Decimal("1.00"),
+            cache_enabled=False
+        )
+        columns, timestamps = year_columns
+
+        fast = backtest_script.run_buy_and_hold(config, columns, timestamps)
+        reference = BacktestEngine().run(config, columns=columns, timestamps=timestamps)
+
+        assert fast.trades == reference.trades
+        assert len(fast.trades) == 1
+        assert fast.equity_curve == reference.equity_curve
+        assert fast.metrics == reference.metrics
+
+    @pytest.fixture
+    def run_main(self, year_columns, monkeypatch):
+        """Run main() on year_columns with the given strategy; return which path ran."""
+        columns, timestamps = year_columns
+        data = pd.DataFrame(columns, index=pd.DatetimeIndex(timestamps))
+        monkeypatch.setattr(backtest_script, "_ensure_env", lambda: None)
+        monkeypatch.setattr(
+            backtest_script,
+            "fetch_historical_data_batch",
+            lambda symbols, period="2y", interval="1d", cache_enabled=True: {"AAPL": data},
+        )
+
+        calls = []
+        run_buy_and_hold = backtest_script.run_buy_and_hold
+        engine_run = BacktestEngine.run
+
+        def recording_buy_and_hold(*args, **kwargs):
+            calls.append("closed_form")
+            return run_buy_and_hold(*args, **kwargs)
+
+        def recording_engine_run(self, *args, **kwargs):
+            calls.append("engine")
+            return engine_run(self, *args, **kwargs)
+
+        monkeypatch.setattr(backtest_script, "run_buy_and_hold", recording_buy_and_hold)
+        monkeypatch.setattr(BacktestEngine, "run", recording_engine_run)
+
+        def run(strategy_class):
+            monkeypatch.setattr(
+                backtest_script,
+                "BacktestConfig",
+                lambda **kwargs: BacktestConfig(**{**kwargs, "strategy_class": strategy_class}),
+            )
+            backtest_script.main()
+            return calls
+
+        return run
+
+    def test_main_uses_closed_form_for_buy_and_hold(self, run_main, capsys):
+        """main() skips the engine when the strategy is BuyAndHoldStrategy itself."""
+        assert run_main(BuyAndHoldStrategy) == ["closed_form"]
+        assert "Trade #1: AAPL" in capsys.readouterr().out
+
+    def test_main_runs_engine_for_other_strategies(self, run_main):
+        """Any other strategy class, including a BuyAndHoldStrategy subclass, uses the engine."""
+
+        class TunedBuyAndHold(BuyAndHoldStrategy):
+            pass
+
+        assert run_main(TunedBuyAndHold) == ["engine"]
+
+
+def _yahoo_frame(start_price: float, n: int = 5):
+    """n daily bars with Yahoo's capitalized column names (int volume, like yfinance)."""
+    close = start_price + np.arange(n, dtype=np.float64)
+    return pd.DataFrame(
+        {
+            "Open": close - 0.25,
+            "High": close + 0.5,
+            "Low": close - 0.5,
+            "Close": close,
+            "Volume": np.full(n, 1_000_000, dtype=np.int64),
+        },
+        index=pd.date_range("2024-01-02", periods=n, freq="D", name="Date"),
+    )
+
+
+def _yahoo_chart(symbol: str, start_price: float, n: int = 5) -> dict:
+    """Minimal Yahoo v8 chart API payload with n daily bars for symbol."""
+    close = [start_price + i for i in range(n)]
+    return {
+        "chart": {
+            "result": [{
+                "meta": {
+                    "currency": "USD",
+                    "symbol": symbol,
+                    "exchangeTimezoneName": "America/New_York",
+                    "timezone": "EST",
+                    "gmtoffset": -18000,
+                    "instrumentType": "EQUITY",
+                    "dataGranularity": "1d",
+                    "range": "2y",
+                    "priceHint": 2,
+                    "validRanges": ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "max"],
+                },
+                "timestamp": [1704205800 + 86400 * i for i in range(n)],  # 2024-01-02 14:30 UTC
+                "indicators": {
+                    "quote": [{
+                        "open": [c - 0.25 for c in close],
+                        "high": [c + 0.5 for c in close],
+                        "low": [c - 0.5 for c in close],
+                        "close": close,
+                        "volume": [1_000_000] * n,
+                    }],
+                    "adjclose": [{"adjclose": close}],
+                },
+            }],
+            "error": None,
+        }
+    }
+
+
+class TestFetchHistoricalData:
+    """Test the batch yf.download fetch path and its parquet cache."""
+
+    @pytest.fixture
+    def fake_download(self, tmp_path, monkeypatch):
+        """Replace yf.download with a stub returning the frame set on it; cache under tmp_path."""
+        monkeypatch.setattr(backtest_script, "CACHE_DIR", tmp_path)
+
+        def download(tickers, **kwargs):
+            download.calls.append(list(tickers))
+            return download.result
+
+        download.calls = []
+        download.result = pd.DataFrame()
+        monkeypatch.setattr(backtest_script.yf, "download", download)
+        return download
+
+    def test_multi_ticker_frame(self, fake_download):
+        """A (ticker, field) MultiIndex frame is split per symbol."""
+        fake_download.result = pd.concat(
+            {"AAPL": _yahoo_frame(150.0), "MSFT": _yahoo_frame(300.0)}, axis=1
+        )
+
+        market_data = backtest_script.fetch_historical_data_batch(["AAPL", "MSFT"])
+
+        assert fake_download.calls == [["AAPL", "MSFT"]]
+        assert list(market_data) == ["AAPL", "MSFT"]
+        assert market_data["MSFT"]["close"].iloc[0] == 300.0
+
+    def test_single_ticker_flat_frame(self, fake_download):
+        """A flat frame (single-ticker yf.download result) is used as is."""
+        fake_download.result = _yahoo_frame(150.0)
+
+        data = backtest_script.fetch_historical_data("AAPL")
+
+        assert len(data) == 5
+        assert data["close"].iloc[-1] == 154.0
+
+    def test_output_is_lowercase_float64_ohlcv(self, fake_download):
+        """Columns are lowercased, limited to OHLCV and cast to float64 (volume included)."""
+        frame = _yahoo_frame(150.0)
+        frame["Dividends"] = 0.0
+        fake_download.result = frame
+
+        data = backtest_script.fetch_historical_data("AAPL")
+
+        assert list(data.columns) == ["open", "high", "low", "close", "volume"]
+        assert (data.dtypes == np.float64).all()
+
+    def test_missing_symbol_is_omitted(self, fake_download):
+        """A symbol absent from the download result is left out of the dict."""
+        fake_download.result = pd.concat({"AAPL": _yahoo_frame(150.0)}, axis=1)
+
+        market_data = backtest_script.fetch_historical_data_batch(["AAPL", "ZZZZ"])
+
+        assert list(market_data) == ["AAPL"]
+
+    def test_all_nan_symbol_is_omitted(self, fake_download):
+        """A symbol whose bars are all NaN (delisted/unknown ticker) is left out."""
+        empty = _yahoo_frame(0.0).astype(np.float64)
+        empty[:] = np.nan
+        fake_download.result = pd.concat({"AAPL": _yahoo_frame(150.0), "ZZZZ": empty}, axis=1)
+
+        market_data = backtest_script.fetch_historical_data_batch(["AAPL", "ZZZZ"])
+
+        assert list(market_data) == ["AAPL"]
+
+
+    def test_real_download_with_mocked_transport(self, tmp_path, monkeypatch):
+        """yf.download runs on the session it builds itself; only HTTP requests are faked.
+
+        Newer yfinance rejects caching sessions (e.g. requests_cache) and relies
+        on its own browser-impersonating session, so none is passed in.
+        """
+        from yfinance.data import YfData
+
+        monkeypatch.setattr(backtest_script, "CACHE_DIR", tmp_path / "ohlcv")
+        backtest_script.yf.set_tz_cache_location(str(tmp_path / "yfinance"))
+        requested = []
+
+        def request(session, method, url, *args, **kwargs):
+            requested.append(url)
+            if "/v8/finance/chart/" in url:
+                symbol = url.rsplit("/", 1)[-1].split("?")[0]
+                body = json.dumps(_yahoo_chart(symbol, 150.0 if symbol == "AAPL" else 300.0))
+            elif "getcrumb" in url:
+                body = "test-crumb"
+            else:
+                body = ""
+            return SimpleNamespace(
+                status_code=200, url=url, text=body, content=body.encode(),
+                headers={}, cookies={}, json=lambda: json.loads(body),
+            )
+
+        monkeypatch.setattr(type(YfData()._session), "request", request)
+
+        market_data = backtest_script.fetch_historical_data_batch(["AAPL", "MSFT"])
+
+        assert sorted(market_data) == ["AAPL", "MSFT"]
+        assert market_data["AAPL"]["close"].tolist() == [150.0, 151.0, 152.0, 153.0, 154.0]
+        assert (market_data["MSFT"].dtypes == np.float64).all()
+        assert any(url.endswith("/chart/AAPL") for url in requested)
+        assert any(url.endswith("/chart/MSFT") for url in requested)
+
+    def test_no_data_raises(self, fake_download):
+        """fetch_historical_data raises ValueError when Yahoo returns nothing."""
+        fake_download.result = pd.DataFrame()
+
+        with pytest.raises(ValueError, match="No data returned for ZZZZ"):
+            backtest_script.fetch_historical_data("ZZZZ")
+
+    def test_fresh_cache_skips_download(self, fake_download):
+        """A second fetch within the TTL is served from the parquet cache."""
+        fake_download.result = _yahoo_frame(150.0)
+        first = backtest_script.fetch_historical_data("AAPL")
+
+        second = backtest_script.fetch_historical_data("AAPL")
+
+        assert len(fake_download.calls) == 1
+        pd.testing.assert_frame_equal(second, first, check_freq=False)
+
+    def test_expired_cache_is_refetched(self, fake_download):
+        """A cache file older than CACHE_TTL_SECONDS triggers a new download."""
+        fake_download.result = _yahoo_frame(150.0)
+        backtest_script.fetch_historical_data("AAPL")
+        cache_path = backtest_script._cache_path("AAPL", "2y", "1d")
+        stale = time.time() - backtest_script.CACHE_TTL_SECONDS - 1
+        os.utime(cache_path, (stale, stale))
+
+        fake_download.result = _yahoo_frame(200.0)
+        data = backtest_script.fetch_historical_data("AAPL")
+
+        assert len(fake_download.calls) == 2
+        assert data["close"].iloc[0] == 200.0
+        assert cache_path.stat().st_mtime > stale
+
+    def test_cache_disabled_neither_reads_nor_writes(self, fake_download, tmp_path):
+        """cache_enabled=False ignores an existing cache file and writes none."""
+        fake_download.result = _yahoo_frame(150.0)
+        backtest_script.fetch_historical_data("AAPL")
+        cache_path = backtest_script._cache_path("AAPL", "2y", "1d")
+        stale = time.time() - 60
+        os.utime(cache_path, (stale, stale))
+
+        backtest_script.fetch_historical_data("AAPL", cache_enabled=False)
+        backtest_script.fetch_historical_data("MSFT", cache_enabled=False)
+
+        assert len(fake_download.calls) == 3
+        assert cache_path.stat().st_mtime == pytest.approx(stale)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [cache_path.name]
+
+    def test_corrupt_cache_is_refetched(self, fake_download):
+        """An unreadable cache file counts as a miss and is replaced."""
+        cache_path = backtest_script._cache_path("AAPL", "2y", "1d")
+        cache_path.write_bytes(b"not a parquet file")
+        fake_download.result = _yahoo_frame(150.0)
+
+        data = backtest_script.fetch_historical_data("AAPL")
+
+        assert len(fake_download.calls) == 1
+        assert len(data) == 5
+        pd.testing.assert_frame_equal(
+            backtest_script._load_cached(cache_path), data, check_freq=False
+        )
+
+    def test_unusable_cache_dir_keeps_fetched_data(self, fake_download, tmp_path, monkeypatch):
+        """A cache directory that cannot be created does not discard downloaded bars."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        monkeypatch.setattr(backtest_script, "CACHE_DIR", blocker / "ohlcv")
+        fake_download.result = _yahoo_frame(150.0)
+
+        data = backtest_script.fetch_historical_data("AAPL")
+
+        assert len(data) == 5
@@ -6,6 +6,7 @@ capital validation, and reproducibility. Following TDD RED phase - tests
 written before BacktestEngine implementation.
 """
 
+import numpy as np
 import pytest
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -819,6 +820,22 @@ class TestBacktestEngineCapitalValidation:
         assert "100" in warning_message, "Warning should mention available capital ($100)"
 
 
+def _bars_to_columns(bars: List[HistoricalDataBar]):
+    """Express bars as the OHLCV arrays + datetime64 timestamps accepted by run(columns=...)."""
+    columns = {
+        "open": np.array([float(b.open) for b in bars]),
+        "high": np.array([float(b.high) for b in bars]),
+        "low": np.array([float(b.low) for b in bars]),
+        "close": np.array([float(b.close) for b in bars]),
+        "volume": np.array([float(b.volume) for b in bars]),
+    }
+    timestamps = np.array(
+        [b.timestamp.replace(tzinfo=None) for b in bars],
+        dtype="datetime64[ns]"
+    )
+    return columns, timestamps
+
+
 class BuyAndHoldStrategy:
     """
     Simple buy-and-hold strategy for testing BacktestEngine execution.
@@ -1072,3 +1089,52 @@ class TestBacktestEngineBuyAndHold:
             f"Should have 0 losses, got {result.metrics.losing_trades}"
         assert result.metrics.win_rate == Decimal("1.0"), \
             f"Win rate should be 100%, got {result.metrics.win_rate * 100:.1f}%"
+
+    def test_buy_and_hold_from_columns(self, mock_year_data: List[HistoricalDataBar]):
+        """
+        Test BacktestEngine.run() with columnar NumPy input matches the bar-list path.
+
+        **Test Scenario**:
+        GIVEN: The same 252 bars expressed as OHLCV arrays plus datetime64 timestamps
+        WHEN: BacktestEngine().run(config, columns=..., timestamps=...) is called
+        THEN: Trades match the run over the equivalent HistoricalDataBar list
+        """
+        config = BacktestConfig(
+            strategy_class=BuyAndHoldStrategy,
+            symbols=["AAPL"],
+            start_date=datetime(2023, 1, 3, 9, 30, tzinfo=timezone.utc),
+            end_date=datetime(2023, 12, 29, 23, 59, 59, tzinfo=timezone.utc),
+            initial_capital=Decimal("100000.00"),
+            commission=Decimal("0.0"),
+            slippage_pct=Decimal("0.0"),
+            risk_free_rate=Decimal("0.02"),
+            cache_enabled=False
+        )
+
+        columns, timestamps = _bars_to_columns(mock_year_data)
+
+        columnar = BacktestEngine().run(config, columns=columns, timestamps=timestamps)
+        reference = BacktestEngine(config=config).run(
+            strategy=BuyAndHoldStrategy(), historical_data={"AAPL": mock_year_data}
+        )
+
+        assert len(columnar.trades) == len(reference.trades) == 1
+        trade, expected = columnar.trades[0], reference.trades[0]
+        assert trade.entry_date == expected.entry_date
+        assert trade.exit_date == expected.exit_date
+        assert trade.shares == expected.shares
+        assert abs(trade.pnl - expected.pnl) < Decimal("0.01")
+
+    def test_columns_require_timestamps(self):
+        """Test run() rejects columnar input without timestamps."""
+        config = BacktestConfig(
+            strategy_class=BuyAndHoldStrategy,
+            symbols=["AAPL"],
+            start_date=datetime(2023, 1, 3, tzinfo=timezone.utc),
+            end_date=datetime(2023, 12, 29, tzinfo=timezone.utc),
+            cache_enabled=False
+        )
+        columns = {c: np.ones(3) for c in ("open", "high", "low", "close", "volume")}
+
+        with pytest.raises(ValueError, match="timestamps required"):
+            BacktestEngine().run(config, columns=columns)